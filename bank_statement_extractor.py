@@ -8,71 +8,156 @@ What it does:
   - Extracts account info (account_number, account_holder_name, account_type, ifsc, micr, bank_name, address)
   - Extracts transactions: transaction_date, description, withdrawal_amount, deposit_amount, balance
   - Flags: DD large withdrawals (>10k), RTGS large deposits (>50k), entities Guddu/Prabhat/Arif/Coal India
-  - Saves account_info.csv and transactions.csv (standardized)
+  - Saves account_info.csv and transactions.csv (standardized), plus transactions.parquet when pyarrow is installed
   - Produces a timeline PNG (deposits & withdrawals) and a one-page PDF report (report.pdf)
 Notes:
   - Tries camelot first (table extraction). If camelot not available or fails, falls back to text parsing with heuristics.
   - For scanned PDFs you will need OCR (pytesseract) — not covered here.
 """
-import os, re, argparse, warnings
-from datetime import datetime
+import os, re, argparse, warnings, hashlib, json, tempfile
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
 import pdfplumber
-import matplotlib.pyplot as plt
 
-# Try to import camelot (optional)
+# Try to import pypdfium2 (optional, faster plain-text reader for the header pages)
 try:
-    import camelot
-    HAS_CAMELOT = True
-except Exception:
-    HAS_CAMELOT = False
+    import pypdfium2 as pdfium
+    HAS_PDFIUM = True
+except ImportError:
+    HAS_PDFIUM = False
 
 # ---------- helper functions ----------
 AMOUNT_RE = re.compile(r'(\d{1,3}(?:,\d{3})*(?:\.\d+)?)')
+NON_NUMERIC_RE = re.compile(r'[^\d\.]')
+DATE_RE = re.compile(r'\d{2}[-/]\d{2}[-/]\d{2,4}')
+LINE_DATE_RE = re.compile(r'^\s*(\d{2}[/-]\d{2}[/-]\d{2,4})\b')
+# flagging rules
+DD_RE = re.compile(r'\bDD\b', re.I)
+RTGS_RE = re.compile(r'RTGS', re.I)
+ENTITIES_RE = re.compile(r'\b(?:guddu|prabhat|arif|coal india)\b', re.I)
+# account info
+ACCT_NO_RE = re.compile(r'Account(?:\s+No(?:\.|)|(?:\s+number)|\s*[:\-])\s*[:\-]?\s*([A-Za-z0-9\-]{6,})', re.I)
+IFSC_RE = re.compile(r'IFSC\s*[:\-]?\s*([A-Z0-9]{11})', re.I)
+MICR_RE = re.compile(r'MICR\s*[:\-]?\s*([0-9]{6,9})', re.I)
+NAME_RE = re.compile(r'^(MR\.|MRS\.|MS\.|MRS|MR|Mrs|Mr)\s*([A-Z][A-Za-z \.&-]{2,})', re.M)
+ADDRESS_RE = re.compile(r'Address\s*[:\-]?\s*(.+?)\n\n', re.S|re.I)
+ACCT_TYPE_RE = re.compile(r'\b(Savings|Current)\b', re.I)
 
-def clean_amount(s):
-    if s is None: 
-        return None
-    s = str(s).replace('Cr','').replace('DR','').replace('-', '').strip()
-    s = s.replace(',', '')
-    s = re.sub(r'[^\d\.]', '', s)
-    if s == '':
+def clean_amount_series(s):
+    """Parses a Series of amount strings: strips everything but digits and '.', unparseable values become NaN."""
+    return pd.to_numeric(s.astype(str).str.replace(NON_NUMERIC_RE, '', regex=True), errors='coerce')
+
+DATE_FORMATS = ("%d-%m-%Y","%d/%m/%Y","%d-%m-%y","%d/%m/%y","%Y-%m-%d")
+
+def parse_dates(s):
+    """
+    Day-first parse of a Series of date strings. Values the inferred format misses are retried with
+    the explicit DATE_FORMATS in order; anything still unparseable or out of range stays NaT.
+    """
+    out = pd.to_datetime(s, dayfirst=True, errors='coerce')
+    for fmt in DATE_FORMATS:
+        retry = out.isna() & s.notna()
+        if not retry.any():
+            break
+        out[retry] = pd.to_datetime(s[retry], format=fmt, errors='coerce')
+    return out
+
+PARALLEL_MIN_PAGES = 4  # below this, worker start-up costs more than it saves
+
+def _extract_one_page(args):
+    pdf_path, i = args
+    with pdfplumber.open(pdf_path, pages=[i + 1]) as pdf:
+        return pdf.pages[0].extract_text() or ''
+
+def _extract_all_text(pdf_path, known_pages=None):
+    """
+    Returns the text of every page (empty string for blank pages), one worker process per page for longer PDFs.
+    known_pages: text of the leading pages already extracted with pdfplumber; only the remaining pages are laid out.
+    """
+    known_pages = list(known_pages or [])
+    with pdfplumber.open(pdf_path) as pdf:
+        num_pages = len(pdf.pages)
+        todo = range(len(known_pages), num_pages)
+        workers = min(os.cpu_count() or 1, len(todo))
+        if len(todo) < PARALLEL_MIN_PAGES or workers < 2:
+            return known_pages + [pdf.pages[i].extract_text() or '' for i in todo]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return known_pages + list(ex.map(_extract_one_page, [(pdf_path, i) for i in todo]))
+
+def _extract_header_text(pdf_path, max_pages=3, use_pdfium=False):
+    """
+    Returns the text of the first max_pages pages via pdfplumber.
+    use_pdfium: read them with pypdfium2 instead (faster, but its text order differs, so account fields can change).
+    """
+    if use_pdfium and not HAS_PDFIUM:
+        warnings.warn('pypdfium2 not installed; reading header pages with pdfplumber')
+    if use_pdfium and HAS_PDFIUM:
+        doc = pdfium.PdfDocument(pdf_path)
+        try:
+            return [doc[i].get_textpage().get_text_range().replace('\r\n', '\n') for i in range(min(max_pages, len(doc)))]
+        finally:
+            doc.close()
+    with pdfplumber.open(pdf_path) as pdf:
+        return [(pdf.pages[i].extract_text() or '') for i in range(min(max_pages, len(pdf.pages)))]
+
+def _page_cache_file(pdf_path, cache_dir):
+    with open(pdf_path, 'rb') as f:
+        h = hashlib.sha256(f.read()).hexdigest()
+    return os.path.join(cache_dir, h + '.json')
+
+def _read_page_cache(pdf_path, cache_dir=None):
+    """Returns the cached page text for this PDF, or None if there is no readable cache entry."""
+    if cache_dir is None:
         return None
     try:
-        return float(s)
-    except:
-        return None
+        with open(_page_cache_file(pdf_path, cache_dir), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None  # missing or unreadable cache entry -> re-extract
 
-def parse_date_try(s):
-    # Try common formats; dayfirst=True
-    for fmt in ("%d-%m-%Y","%d/%m/%Y","%d-%m-%y","%d/%m/%y","%Y-%m-%d"):
-        try:
-            return datetime.strptime(s.strip(), fmt).date()
-        except:
-            pass
-    # fallback to pandas
+def _pages_text_cached(pdf_path, cache_dir=None, known_pages=None):
+    """_extract_all_text memoized on disk as cache_dir/<sha256 of the PDF>.json (no caching if cache_dir is None)."""
+    if cache_dir is None:
+        return _extract_all_text(pdf_path, known_pages)
+    pages_text = _read_page_cache(pdf_path, cache_dir)
+    if pages_text is not None:
+        return pages_text
+    cache_file = _page_cache_file(pdf_path, cache_dir)
+    pages_text = _extract_all_text(pdf_path, known_pages)
+    # write to a temp file and rename, so an interrupted run never leaves a truncated entry;
+    # any cache failure only costs the speed-up, never the run
+    tmp_path = None
     try:
-        return pd.to_datetime(s, dayfirst=True, errors='coerce').date()
-    except:
-        return None
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(pages_text, f)
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        warnings.warn(f'Could not write page-text cache: {e}')
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return pages_text
 
 # ---------- extract account info ----------
-def extract_account_info(pdf_path):
-    """Searches the first 2 pages for IFSC, MICR, account number, holder name, bank name."""
-    with pdfplumber.open(pdf_path) as pdf:
-        text = '\n'.join((pdf.pages[i].extract_text() or '') for i in range(min(3, len(pdf.pages))))
+def extract_account_info(pages_text):
+    """Searches the first 3 pages for IFSC, MICR, account number, holder name, bank name."""
+    header_pages = pages_text[:3]
+    text = '\n'.join(header_pages)
+    first_page_lines = header_pages[0].splitlines() if header_pages else []
     # Account number
-    m = re.search(r'Account(?:\s+No(?:\.|)|(?:\s+number)|\s*[:\-])\s*[:\-]?\s*([A-Za-z0-9\-]{6,})', text, re.I)
+    m = ACCT_NO_RE.search(text)
     account_number = m.group(1).strip() if m else None
     # IFSC
-    m = re.search(r'IFSC\s*[:\-]?\s*([A-Z0-9]{11})', text, re.I)
+    m = IFSC_RE.search(text)
     ifsc = m.group(1) if m else None
     # MICR
-    m = re.search(r'MICR\s*[:\-]?\s*([0-9]{6,9})', text, re.I)
+    m = MICR_RE.search(text)
     micr = m.group(1) if m else None
     # account holder name: try lines with MR./MRS. or first uppercase line blocks
     name = None
-    m = re.search(r'^(MR\.|MRS\.|MS\.|MRS|MR|Mrs|Mr)\s*([A-Z][A-Za-z \.&-]{2,})', text, re.M)
+    m = NAME_RE.search(text)
     if m:
         name = m.group(0).strip()
     else:
@@ -83,14 +168,12 @@ def extract_account_info(pdf_path):
                 name = ln
                 break
     # bank name - top of doc (first line of first page)
-    with pdfplumber.open(pdf_path) as pdf:
-        first_page_text = (pdf.pages[0].extract_text() or '').splitlines()
-    bank_name = first_page_text[0].strip() if first_page_text else None
+    bank_name = first_page_lines[0].strip() if first_page_lines else None
     # address attempt
-    m = re.search(r'Address\s*[:\-]?\s*(.+?)\n\n', text, re.S|re.I)
+    m = ADDRESS_RE.search(text)
     address = m.group(1).strip() if m else None
     # account type (search for "Savings" / "Current")
-    m = re.search(r'\b(Savings|Current)\b', text, re.I)
+    m = ACCT_TYPE_RE.search(text)
     account_type = m.group(1).title() if m else None
     return {
         'account_number': account_number,
@@ -103,136 +186,142 @@ def extract_account_info(pdf_path):
     }
 
 # ---------- extract transaction table ----------
-def extract_transactions(pdf_path):
+TX_COLUMNS = ['transaction_date','description','withdrawal_amount','deposit_amount','balance']
+# float32 would halve memory but rounds paise once balances pass ~1 lakh, so amounts stay float64 in every output
+AMOUNT_DTYPE = 'float64'
+
+def _standardize_transactions(df_out):
+    """Final normalization shared by both extraction paths: parsed dates, one fixed amount dtype, standard column order."""
+    df_out['transaction_date'] = parse_dates(df_out['transaction_date'])
+    amount_cols = ['withdrawal_amount','deposit_amount','balance']
+    df_out[amount_cols] = df_out[amount_cols].astype(AMOUNT_DTYPE)
+    return df_out[TX_COLUMNS]
+
+def extract_transactions(pdf_path, pages_text=None, cache_dir=None, header_pages=None):
     """
     Returns a DataFrame with columns:
     transaction_date, description, withdrawal_amount, deposit_amount, balance
+    pages_text: optional per-page text from _extract_all_text, reused by the text fallback.
+    cache_dir: optional page-text cache folder used when pages_text is not given.
+    header_pages: optional pdfplumber text of the leading pages, so the fallback only extracts the rest.
     """
-    # 1) Try camelot (table extraction)
-    if HAS_CAMELOT:
+    # 1) Try camelot (table extraction); optional and slow to import, so only loaded here
+    try:
+        import camelot
+    except Exception:
+        camelot = None
+    if camelot is not None:
         try:
             tables = camelot.read_pdf(pdf_path, pages='all', flavor='stream')
             # look for tables where first col has lots of dates
-            date_pattern = re.compile(r'\d{2}[-/]\d{2}[-/]\d{2,4}')
             for t in tables:
                 df = t.df.copy()
                 # check if first col has date-like entries (>=2)
                 firstcol = df.iloc[:,0].astype(str)
-                hits = sum(1 for v in firstcol if date_pattern.search(v))
+                hits = firstcol.str.contains(DATE_RE, na=False).sum()
                 if hits >= 2:  # likely the transactions table
                     # heuristic: last 2-3 columns contain amounts
                     # standardize columns to strings
-                    df = df.applymap(lambda x: x.strip() if isinstance(x,str) else x)
-                    records = []
-                    for _, row in df.iterrows():
-                        first = str(row.iloc[0])
-                        m = date_pattern.search(first)
-                        if not m:
-                            continue
-                        date = m.group(0)
+                    for c in df.columns:
+                        df[c] = df[c].astype(str).str.strip()
+                    first = df.iloc[:,0]
+                    dates = first.str.extract(f'({DATE_RE.pattern})', expand=False)
+                    mask = dates.notna()
+                    rows = df.loc[mask]
+                    ncols = df.shape[1]
+                    if ncols >= 4:
                         # description = join middle columns (1 .. -3)
-                        if df.shape[1] >= 4:
-                            desc_cols = df.columns[1:df.shape[1]-3] if df.shape[1] > 4 else df.columns[1:-2]
-                            desc = ' '.join(str(row[c]) for c in desc_cols).strip()
-                            # last three columns -> amounts
-                            tail = [str(row[c]) for c in df.columns[-3:]]
-                            w = clean_amount(tail[0]) if tail and tail[0] else None
-                            d = clean_amount(tail[1]) if len(tail) > 1 and tail[1] else None
-                            b = clean_amount(tail[-1]) if tail[-1] else None
-                        else:
-                            # fallback: put the rest as description and try to extract numbers
-                            rest = ' '.join(str(x) for x in row.iloc[1:])
-                            desc = rest
-                            nums = AMOUNT_RE.findall(rest)
-                            w = d = b = None
-                            if len(nums) >= 3:
-                                w = clean_amount(nums[-3]); d = clean_amount(nums[-2]); b = clean_amount(nums[-1])
-                        records.append({
-                            'transaction_date': date,
+                        desc_cols = df.columns[1:ncols-3] if ncols > 4 else df.columns[1:-2]
+                        desc = rows[desc_cols[0]].str.cat(rows[desc_cols[1:]], sep=' ').str.strip()
+                        # last three columns -> amounts
+                        w, d, b = (rows[c] for c in df.columns[-3:])
+                    else:
+                        # fallback: put the rest as description and try to extract numbers
+                        rest = rows.iloc[:,1:]
+                        if rest.shape[1]:
+                            desc = rest.iloc[:,0].str.cat(rest.iloc[:,1:], sep=' ')
+                        else:  # single-column table: dates only
+                            desc = pd.Series('', index=rows.index, dtype=str)
+                        nums = desc.str.findall(AMOUNT_RE)
+                        nums = nums.where(nums.str.len() >= 3, None)
+                        w, d, b = nums.str[-3], nums.str[-2], nums.str[-1]
+                    w, d, b = (clean_amount_series(v) for v in (w, d, b))
+                    if mask.any():
+                        df_out = pd.DataFrame({
+                            'transaction_date': dates[mask],
                             'description': desc,
                             'withdrawal_amount': w,
                             'deposit_amount': d,
                             'balance': b
-                        })
-                    if records:
-                        df_out = pd.DataFrame(records)
-                        # normalize columns
-                        df_out['transaction_date'] = pd.to_datetime(df_out['transaction_date'], dayfirst=True, errors='coerce')
-                        df_out['withdrawal_amount'] = pd.to_numeric(df_out['withdrawal_amount'], errors='coerce')
-                        df_out['deposit_amount'] = pd.to_numeric(df_out['deposit_amount'], errors='coerce')
-                        df_out['balance'] = pd.to_numeric(df_out['balance'], errors='coerce')
-                        return df_out[['transaction_date','description','withdrawal_amount','deposit_amount','balance']]
+                        }).reset_index(drop=True)
+                        return _standardize_transactions(df_out)
         except Exception as e:
             warnings.warn(f'Camelot extraction failed: {e}')
 
     # 2) Fallback: text parsing using pdfplumber
-    with pdfplumber.open(pdf_path) as pdf:
-        pages_text = [page.extract_text() or '' for page in pdf.pages]
+    if pages_text is None:
+        pages_text = _pages_text_cached(pdf_path, cache_dir, header_pages)
     full_text = '\n'.join(pages_text)
-    lines = full_text.splitlines()
-    date_rx = re.compile(r'^\s*(\d{2}[/-]\d{2}[/-]\d{2,4})\b')
-    records = []
-    current = None
-    for line in lines:
-        line = line.rstrip()
-        m = date_rx.match(line)
-        if m:
-            if current:
-                records.append(current)
-            date_str = m.group(1)
-            after = line[m.end():].strip()
-            nums = AMOUNT_RE.findall(line)
-            # heuristics for mapping numbers to withdraw/deposit/balance
-            w = d = b = None
-            if len(nums) >= 3:
-                w = clean_amount(nums[-3]); d = clean_amount(nums[-2]); b = clean_amount(nums[-1])
-            elif len(nums) == 2:
-                # often deposit + balance or withdrawal + balance; we'll assume deposit + balance if the earlier text contains 'CR' or amounts order
-                d = clean_amount(nums[-2]); b = clean_amount(nums[-1])
-            elif len(nums) == 1:
-                b = clean_amount(nums[-1])
-            current = {'transaction_date': date_str, 'description': after, 'withdrawal_amount': w, 'deposit_amount': d, 'balance': b}
-        else:
-            # continuation of description
-            if current:
-                current['description'] = (current.get('description') or '') + ' ' + line.strip()
-    if current:
-        records.append(current)
-    df_out = pd.DataFrame(records)
-    if df_out.empty:
-        return df_out  # empty DataFrame
-    # normalize
-    df_out['transaction_date'] = pd.to_datetime(df_out['transaction_date'], dayfirst=True, errors='coerce')
-    df_out['withdrawal_amount'] = pd.to_numeric(df_out['withdrawal_amount'], errors='coerce')
-    df_out['deposit_amount'] = pd.to_numeric(df_out['deposit_amount'], errors='coerce')
-    df_out['balance'] = pd.to_numeric(df_out['balance'], errors='coerce')
-    return df_out[['transaction_date','description','withdrawal_amount','deposit_amount','balance']]
+    lines = pd.Series(full_text.splitlines(), dtype=str).str.rstrip()
+    is_date = lines.str.match(LINE_DATE_RE)
+    if not is_date.any():
+        return pd.DataFrame()  # empty DataFrame
+    dated = lines[is_date]
+    dates = dated.str.extract(LINE_DATE_RE, expand=False)
+    # every line up to the next dated line is a continuation of the description
+    group_id = is_date.cumsum()
+    after = dated.str.replace(LINE_DATE_RE, '', regex=True).str.strip()
+    pieces = (' ' + lines.str.strip()).mask(is_date, after)
+    in_tx = group_id > 0
+    desc = pieces[in_tx].groupby(group_id[in_tx]).agg(''.join)
+    desc.index = dated.index
+    # heuristics for mapping numbers to withdraw/deposit/balance:
+    # 3+ numbers -> withdrawal, deposit, balance; 2 -> deposit + balance; 1 -> balance
+    nums = dated.str.findall(AMOUNT_RE)
+    n = nums.str.len()
+    df_out = pd.DataFrame({
+        'transaction_date': dates,
+        'description': desc,
+        'withdrawal_amount': clean_amount_series(nums.str[-3].where(n >= 3)),
+        'deposit_amount': clean_amount_series(nums.str[-2].where(n >= 2)),
+        'balance': clean_amount_series(nums.str[-1])
+    }).reset_index(drop=True)
+    return _standardize_transactions(df_out)
 
 # ---------- analysis / flagging ----------
 def flag_transactions(df):
     df = df.copy()
     df['description'] = df['description'].fillna('').astype(str)
-    df['flag_DD_large_withdrawal'] = df.apply(
-        lambda r: (r['withdrawal_amount'] or 0) > 10000 and bool(re.search(r'\bDD\b', r['description'], re.I)),
-        axis=1
-    )
-    df['flag_RTGS_large_deposit'] = df.apply(
-        lambda r: (r['deposit_amount'] or 0) > 50000 and bool(re.search(r'RTGS', r['description'], re.I)),
-        axis=1
-    )
+    desc = df['description']
+    dd_mask = desc.str.contains(DD_RE, na=False).to_numpy(dtype=bool)
+    withdrawals = df['withdrawal_amount'].fillna(0).to_numpy(dtype=float)
+    df['flag_DD_large_withdrawal'] = np.logical_and(dd_mask, np.greater(withdrawals, 10000))
+    rtgs_mask = desc.str.contains(RTGS_RE, na=False).to_numpy(dtype=bool)
+    deposits = df['deposit_amount'].fillna(0).to_numpy(dtype=float)
+    df['flag_RTGS_large_deposit'] = np.logical_and(rtgs_mask, np.greater(deposits, 50000))
     # entities: Guddu, Prabhat, Arif, Coal India
-    pattern = re.compile(r'\b(guddu|prabhat|arif|coal india)\b', re.I)
-    df['flag_entities'] = df['description'].apply(lambda s: bool(pattern.search(s)))
+    df['flag_entities'] = desc.str.contains(ENTITIES_RE, na=False)
     return df
 
 # ---------- plotting ----------
+TIMELINE_MAX_DAYS_FROM_MEDIAN = 400  # statements cover about a year; dates further out are mis-reads
+
 def plot_timeline(df, out_png):
+    import matplotlib.pyplot as plt
     df2 = df.copy()
-    df2['date'] = pd.to_datetime(df2['transaction_date'], errors='coerce')
-    group = df2.groupby('date').agg({'deposit_amount':'sum','withdrawal_amount':'sum'}).fillna(0).sort_index()
+    # extract_transactions already returns datetimes; only parse other inputs
+    if pd.api.types.is_datetime64_any_dtype(df2['transaction_date']):
+        df2['date'] = df2['transaction_date']
+    else:
+        df2['date'] = pd.to_datetime(df2['transaction_date'], errors='coerce')
+    # a single mis-read year would stretch the daily bins over centuries, so keep the statement's main span
+    df2 = df2.dropna(subset=['date'])
+    df2 = df2[(df2['date'] - df2['date'].median()).abs() <= pd.Timedelta(days=TIMELINE_MAX_DAYS_FROM_MEDIAN)]
+    # one bin per calendar day, days without transactions sum to 0
+    daily = df2.set_index('date')[['deposit_amount','withdrawal_amount']].resample('D').sum()
     plt.figure(figsize=(10,4))
-    plt.plot(group.index, group['deposit_amount'], label='Deposits', marker='o')
-    plt.plot(group.index, group['withdrawal_amount'], label='Withdrawals', marker='o')
+    plt.plot(daily.index, daily['deposit_amount'], label='Deposits', marker='o')
+    plt.plot(daily.index, daily['withdrawal_amount'], label='Withdrawals', marker='o')
     plt.legend()
     plt.title('Daily deposits and withdrawals')
     plt.xlabel('Date')
@@ -267,10 +356,11 @@ def make_report(account_info, transactions_df, plot_png, out_pdf, name='Your Nam
     story.append(Spacer(1,8))
     # summary counts
     story.append(Paragraph("<b>Flags summary</b>", normal))
+    counts = transactions_df[['flag_DD_large_withdrawal','flag_RTGS_large_deposit','flag_entities']].sum().astype(int)
     flag_counts = [
-        ['DD large withdrawals (>10k)', str(int(transactions_df['flag_DD_large_withdrawal'].sum()))],
-        ['RTGS large deposits (>50k)', str(int(transactions_df['flag_RTGS_large_deposit'].sum()))],
-        ['Named entities (Guddu/Prabhat/Arif/Coal India)', str(int(transactions_df['flag_entities'].sum()))]
+        ['DD large withdrawals (>10k)', str(counts['flag_DD_large_withdrawal'])],
+        ['RTGS large deposits (>50k)', str(counts['flag_RTGS_large_deposit'])],
+        ['Named entities (Guddu/Prabhat/Arif/Coal India)', str(counts['flag_entities'])]
     ]
     story.append(Table(flag_counts))
     story.append(Spacer(1,8))
@@ -281,20 +371,41 @@ def make_report(account_info, transactions_df, plot_png, out_pdf, name='Your Nam
     doc.build(story)
 
 # ---------- main driver ----------
-def main(pdf_path, outdir, name, email):
+# explicit formats so pandas skips per-value repr/isoformat work when writing large tables
+CSV_OPTIONS = dict(index=False, date_format='%Y-%m-%d', float_format='%.2f', chunksize=10_000)
+
+def main(pdf_path, outdir, name, email, fast_header=False):
     os.makedirs(outdir, exist_ok=True)
+    cache_dir = os.path.join(outdir, '.pdfcache')
     print("Extracting account info...")
-    acc = extract_account_info(pdf_path)
+    # a warm page cache already holds every page; otherwise only the header pages are read up front
+    # and the fallback extracts the remaining pages if camelot finds no table
+    pages_text = _read_page_cache(pdf_path, cache_dir)
+    if pages_text is not None and not fast_header:
+        header_pages = pages_text[:3]
+    else:
+        header_pages = _extract_header_text(pdf_path, use_pdfium=fast_header)
+    acc = extract_account_info(header_pages)
     print("Extracting transactions (this may take a moment)...")
-    tx = extract_transactions(pdf_path)
+    # pdfium text is laid out differently, so only pdfplumber header pages can stand in for the first pages
+    tx = extract_transactions(pdf_path, pages_text, cache_dir, header_pages=None if fast_header else header_pages)
     if tx.empty:
         print("Warning: No transactions extracted. Check if PDF is scanned image (OCR required) or layout unknown.")
     tx_flags = flag_transactions(tx)
+    # repeated narrations (bank codes, standing instructions) compress well as categories
+    if len(tx_flags) and tx_flags['description'].nunique() / len(tx_flags) < 0.5:
+        tx_flags['description'] = tx_flags['description'].astype('category')
     # Save CSVs
     acc_df = pd.DataFrame([acc])
-    acc_df.to_csv(os.path.join(outdir,'account_info.csv'), index=False)
-    tx_flags.to_csv(os.path.join(outdir,'transactions.csv'), index=False)
+    acc_df.to_csv(os.path.join(outdir,'account_info.csv'), **CSV_OPTIONS)
+    tx_flags.to_csv(os.path.join(outdir,'transactions.csv'), **CSV_OPTIONS)
     print(f"Saved account_info.csv and transactions.csv in {outdir}")
+    # typed columnar copy for downstream analysis (CSV stays for human inspection)
+    try:
+        tx_flags.to_parquet(os.path.join(outdir,'transactions.parquet'), engine='pyarrow', compression='snappy', index=False)
+        print("Saved transactions.parquet in", outdir)
+    except Exception as e:
+        print("Could not write transactions.parquet:", e)
     # Plot timeline (if any)
     png = os.path.join(outdir, 'timeline.png')
     try:
@@ -316,5 +427,7 @@ if __name__ == '__main__':
     parser.add_argument('--outdir', default='output', help='Output folder')
     parser.add_argument('--name', default='Your Name', help='Your name for report')
     parser.add_argument('--email', default='you@example.com', help='Your email for report')
+    parser.add_argument('--fast-header', action='store_true',
+                        help='Read header pages with pypdfium2 (faster; account fields may differ from the default)')
     args = parser.parse_args()
-    main(args.pdf, args.outdir, args.name, args.email)
+    main(args.pdf, args.outdir, args.name, args.email, fast_header=args.fast_header)